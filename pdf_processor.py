@@ -15,17 +15,17 @@ Example:
 
 import argparse
 import os
+import shutil
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 import logging
+from logging.handlers import RotatingFileHandler
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 try:
     import fitz  # PyMuPDF
-    import PyPDF2
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.colors import blue
 except ImportError as e:
     print(f"Error: Required dependencies not installed. Please run: uv sync")
     print(f"Missing dependency: {e}")
@@ -39,7 +39,10 @@ def setup_logging():
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler('pdf_processor.log')
+            # Cap the log file so unattended batches cannot grow it
+            # without bound
+            RotatingFileHandler('pdf_processor.log',
+                                maxBytes=10_000_000, backupCount=3)
         ]
     )
 
@@ -60,9 +63,14 @@ def find_pdf_files(directory: Path) -> List[Path]:
     if not directory.is_dir():
         raise NotADirectoryError(f"{directory} is not a directory")
     
-    # Recursively find all PDF files
-    pdf_files = list(directory.rglob("*.pdf"))
-    logging.info(f"Found {len(pdf_files)} PDF files in {directory} and subdirectories")
+    # Recursively find all PDF files. os.walk rides on os.scandir, so the
+    # file/dir distinction comes from the dirent without a stat per entry
+    # (rglob stats each match); the lowercase check also picks up .PDF
+    pdf_files = [Path(root, name)
+                 for root, _dirs, names in os.walk(directory)
+                 for name in names
+                 if name.lower().endswith('.pdf')]
+    logging.info("Found %d PDF files in %s and subdirectories", len(pdf_files), directory)
     
     return pdf_files
 
@@ -72,654 +80,346 @@ def hex_to_rgb(hex_color: str) -> tuple:
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) / 255.0 for i in (0, 2, 4))
 
-def replace_text_overlay(input_path: Path, output_path: Path, old_text: str, new_text: str) -> bool:
-    """
-    Replace text using overlay method with perfect alignment preservation.
-    
-    Args:
-        input_path: Path to the input PDF file
-        output_path: Path to save the modified PDF file
-        old_text: Text to replace
-        new_text: New text to insert
-        
-    Returns:
-        True if successful, False otherwise
-    """
-    try:
-        # Open the PDF document
-        doc = fitz.open(input_path)
-        page = doc[0]
-        
-        # Get text blocks with detailed formatting
-        blocks = page.get_text("dict")["blocks"]
-        
-        # Find the target text span
-        target_span = None
-        for block in blocks:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        if old_text in span["text"]:
-                            target_span = span
-                            break
-                    if target_span:
-                        break
-                if target_span:
-                    break
-        
-        if not target_span:
-            logging.info(f"Text '{old_text}' not found in {input_path.name}")
-            doc.close()
-            return False
-        
-        logging.info(f"Found '{old_text}' with font: {target_span['font']}, size: {target_span['size']}")
-        
-        # Create a white rectangle to cover the old text
-        rect = fitz.Rect(target_span["bbox"])
-        page.add_redact_annot(rect, fill=(1, 1, 1))  # White fill
-        page.apply_redactions()
-        
-        # Insert the new text with exact positioning and formatting
-        point = fitz.Point(rect.x0, rect.y1 - 2)
-        page.insert_text(
-            point,
-            new_text,
-            fontsize=target_span["size"],
-            fontname=target_span["font"],
-            color=hex_to_rgb("#0066cc")
-        )
-        
-        # Save the modified document
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
-        doc.close()
-        
-        logging.info(f"Successfully replaced '{old_text}' with '{new_text}' in {input_path.name}")
-        return True
-        
-    except Exception as e:
-        logging.error(f"Error processing {input_path.name}: {str(e)}")
-        return False
 
-def replace_text_direct(input_path: Path, output_path: Path, old_text: str, new_text: str) -> bool:
-    """
-    Replace text using direct text replacement without redaction to preserve layout.
-    
-    Args:
-        input_path: Path to the input PDF file
-        output_path: Path to save the modified PDF file
-        old_text: Text to replace
-        new_text: New text to insert
-        
-    Returns:
-        True if successful, False otherwise
-    """
-    try:
-        # Open the PDF document
-        doc = fitz.open(input_path)
-        page = doc[0]
-        
-        # Get text blocks with detailed formatting
-        blocks = page.get_text("dict")["blocks"]
-        
-        # Find the target text span
-        target_span = None
-        for block in blocks:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        if old_text in span["text"]:
-                            target_span = span
-                            break
-                    if target_span:
-                        break
-                if target_span:
-                    break
-        
-        if not target_span:
-            logging.info(f"Text '{old_text}' not found in {input_path.name}")
-            doc.close()
-            return False
-        
-        logging.info(f"Found '{old_text}' with font: {target_span['font']}, size: {target_span['size']}")
-        
-        # Create a new page with the same dimensions
-        new_page = doc.new_page(width=page.rect.width, height=page.rect.height)
-        
-        # Copy all content from original page with exact positioning
-        for block in blocks:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        span_text = span["text"]
-                        
-                        # Replace the target text
-                        if old_text in span_text:
-                            span_text = span_text.replace(old_text, new_text)
-                            logging.info(f"Replacing '{old_text}' with '{new_text}'")
-                        
-                        # Insert text with exact formatting and positioning
-                        if span_text.strip():  # Only insert non-empty text
-                            # Use the specified blue color for the title
-                            if new_text in span_text:
-                                color = hex_to_rgb("#0066cc")  # Use the specified blue color
-                            else:
-                                # Keep original color for other text
-                                color = span.get("color", (0, 0, 0))
-                                if isinstance(color, (int, float)):
-                                    if color > 0:
-                                        color = (0, 0, 0)  # Keep original color for non-title text
-                                    else:
-                                        color = (0, 0, 0)  # Black for default
-                                elif not isinstance(color, (tuple, list)) or len(color) not in [1, 3, 4]:
-                                    color = (0, 0, 0)  # Default to black
-                            
-                            # Use exact positioning from the original span
-                            new_page.insert_text(
-                                fitz.Point(span["bbox"][0], span["bbox"][3] - 2),
-                                span_text,
-                                fontsize=span["size"],
-                                fontname=span["font"],
-                                color=color
-                            )
-        
-        # Replace the original page with the new one
-        doc.delete_page(0)
-        doc.insert_page(0, new_page)
-        
-        # Save the modified document
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
-        doc.close()
-        
-        logging.info(f"Successfully replaced '{old_text}' with '{new_text}' in {input_path.name}")
-        return True
-        
-    except Exception as e:
-        logging.error(f"Error processing {input_path.name}: {str(e)}")
-        return False
+# The replacement title is always the same blue; convert it once at import
+TITLE_COLOR_RGB = hex_to_rgb("#0066cc")
 
-def replace_text_clean(input_path: Path, output_path: Path, old_text: str, new_text: str) -> bool:
+# The one title swap this tool performs; every replacer and check below
+# works against these
+OLD_TEXT = "KYC Report"
+NEW_TEXT = "PD Report"
+
+# Fallback order for the replacement methods in process_pdf
+METHOD_ORDER = ['clean', 'minimal', 'direct', 'overlay', 'precise', 'standard', 'simple']
+
+def _save_doc(doc, output_path: Path) -> None:
     """
-    Replace text using clean approach - draw white rectangle then overlay new text.
-    
-    Args:
-        input_path: Path to the input PDF file
-        output_path: Path to save the modified PDF file
-        old_text: Text to replace
-        new_text: New text to insert
-        
-    Returns:
-        True if successful, False otherwise
+    Save a modified document with garbage collection and compression.
+
+    garbage=3 drops unreferenced objects, deflate compresses the streams
+    we touched, and clean sanitizes the content streams. When the output
+    is the input file itself, an incremental save appends just a new xref
+    section instead of rewriting every untouched object.
     """
-    try:
-        # Open the PDF document
-        doc = fitz.open(input_path)
-        page = doc[0]
-        
-        # Get text blocks with detailed formatting
-        blocks = page.get_text("dict")["blocks"]
-        
-        # Find the target text span
-        target_span = None
-        for block in blocks:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        if old_text in span["text"]:
-                            target_span = span
-                            break
-                    if target_span:
-                        break
-                if target_span:
-                    break
-        
-        if not target_span:
-            logging.info(f"Text '{old_text}' not found in {input_path.name}")
-            doc.close()
-            return False
-        
-        logging.info(f"Found '{old_text}' with font: {target_span['font']}, size: {target_span['size']}")
-        
-        # Draw a white rectangle to cover the old text
-        bbox = target_span["bbox"]
-        # Expand the rectangle to ensure complete coverage
-        expanded_rect = fitz.Rect(
-            bbox[0] - 3,  # Left: extend more
-            bbox[1] - 3,  # Top: extend more
-            bbox[2] + 3,  # Right: extend more
-            bbox[3] + 3   # Bottom: extend more
-        )
-        
-        # Draw white rectangle
-        page.draw_rect(expanded_rect, color=(1, 1, 1), fill=(1, 1, 1))
-        
-        # Insert the new text at the exact position (moved up slightly)
-        point = fitz.Point(bbox[0], bbox[3] - 5)
-        page.insert_text(
-            point,
-            new_text,
-            fontsize=target_span["size"],
-            fontname=target_span["font"],
-            color=hex_to_rgb("#0066cc")
-        )
-        
-        # Save the modified document
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
-        doc.close()
-        
-        logging.info(f"Successfully replaced '{old_text}' with '{new_text}' in {input_path.name}")
-        return True
-        
-    except Exception as e:
-        logging.error(f"Error processing {input_path.name}: {str(e)}")
-        return False
+    if output_path.exists() and output_path.samefile(doc.name):
+        doc.save(output_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+    else:
+        doc.save(output_path, garbage=3, deflate=True, deflate_images=True, clean=True)
+
+
+def _find_span(blocks, needle: str):
+    """Return the first span whose text contains needle, or None."""
+    for block in blocks:
+        for line in block.get("lines", ()):
+            for span in line["spans"]:
+                if needle in span["text"]:
+                    return span
+    return None
 
-def replace_text_minimal(input_path: Path, output_path: Path, old_text: str, new_text: str) -> bool:
+
+def _open_and_find_span(input_path: Path, old_text: str):
     """
-    Replace text using minimal approach - cover old text with white rectangle then overlay new text.
-    
+    Open a PDF and locate the first page-1 span containing the target text.
+
+    This is the single scan the whole fallback chain shares: the caller
+    owns the returned document and must close it.
+
     Args:
         input_path: Path to the input PDF file
-        output_path: Path to save the modified PDF file
-        old_text: Text to replace
-        new_text: New text to insert
-        
+        old_text: Text to search for
+
     Returns:
-        True if successful, False otherwise
+        Tuple of (doc, page, target_span); target_span is None when the
+        text is not on the first page
     """
-    try:
-        # Open the PDF document
-        doc = fitz.open(input_path)
-        page = doc[0]
-        
-        # Get text blocks with detailed formatting
-        blocks = page.get_text("dict")["blocks"]
-        
-        # Find the target text span
-        target_span = None
-        for block in blocks:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        if old_text in span["text"]:
-                            target_span = span
-                            break
-                    if target_span:
-                        break
-                if target_span:
-                    break
-        
-        if not target_span:
-            logging.info(f"Text '{old_text}' not found in {input_path.name}")
-            doc.close()
-            return False
-        
-        logging.info(f"Found '{old_text}' with font: {target_span['font']}, size: {target_span['size']}")
-        
-        # Create a larger white rectangle to ensure complete coverage of the old text
-        bbox = target_span["bbox"]
-        # Expand the rectangle slightly to ensure complete coverage
-        expanded_rect = fitz.Rect(
-            bbox[0] - 2,  # Left: extend slightly left
-            bbox[1] - 2,  # Top: extend slightly up
-            bbox[2] + 2,  # Right: extend slightly right
-            bbox[3] + 2   # Bottom: extend slightly down
-        )
-        page.add_redact_annot(expanded_rect, fill=(1, 1, 1))  # White fill
-        page.apply_redactions()
-        
-        # Insert the new text at the exact position
-        point = fitz.Point(bbox[0], bbox[3] - 2)
-        page.insert_text(
-            point,
-            new_text,
-            fontsize=target_span["size"],
-            fontname=target_span["font"],
-            color=hex_to_rgb("#0066cc")
-        )
-        
-        # Save the modified document
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
-        doc.close()
-        
-        logging.info(f"Successfully replaced '{old_text}' with '{new_text}' in {input_path.name}")
-        return True
-        
-    except Exception as e:
-        logging.error(f"Error processing {input_path.name}: {str(e)}")
-        return False
+    doc = fitz.open(input_path)
+    page = doc[0]
+
+    # Let MuPDF search for the text natively first: the common "not
+    # found" case exits with one C call, without ever building the
+    # full Python text dict. The text is a title, so try the top strip
+    # of the page before paying for a whole-page scan.
+    header_clip = fitz.Rect(0, 0, page.rect.width, page.rect.height * 0.25)
+    hits = page.search_for(old_text, clip=header_clip)
+    if not hits:
+        hits = page.search_for(old_text)
+    if not hits:
+        return doc, page, None
+
+    # Extract formatting details only for the region around the hit,
+    # falling back to the whole page if clipping cut the span short
+    for clip in (hits[0], None):
+        span = _find_span(page.get_text("dict", clip=clip)["blocks"], old_text)
+        if span is not None:
+            return doc, page, span
+
+    return doc, page, None
 
-def replace_text_precise(input_path: Path, output_path: Path, old_text: str, new_text: str) -> bool:
+
+@dataclass(frozen=True)
+class MethodParams:
     """
-    Replace text in a PDF file using PyMuPDF with precise formatting preservation.
-    
-    Args:
-        input_path: Path to the input PDF file
-        output_path: Path to save the modified PDF file
-        old_text: Text to replace
-        new_text: New text to insert
-        
-    Returns:
-        True if successful, False otherwise
+    How one replacement method covers the old title and places the new one.
+
+    The historical replace_text_* variants differed only in these knobs:
+
+    pad: how far the cover rectangle extends beyond the span bbox
+    use_redact: remove the old text via redaction instead of painting a
+        white rectangle over it
+    y_offset: baseline offset from the span's bottom edge for insert_text
+    multi: cover every search_for hit on the page, not just the located span
     """
-    try:
-        # Open the PDF document
-        doc = fitz.open(input_path)
-        
-        # Process only the first page
-        page = doc[0]
-        
-        # Get text blocks with detailed formatting
-        blocks = page.get_text("dict")["blocks"]
-        
-        # Find the text block containing our target text
-        target_span = None
-        
-        for block in blocks:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        if old_text in span["text"]:
-                            target_span = span
-                            break
-                    if target_span:
-                        break
-                if target_span:
-                    break
-        
-        if not target_span:
-            logging.info(f"Text '{old_text}' not found in {input_path.name}")
-            doc.close()
-            return False
-        
-        logging.info(f"Found '{old_text}' with font: {target_span['font']}, size: {target_span['size']}")
-        
-        # Create a new page with the same dimensions
-        new_page = doc.new_page(width=page.rect.width, height=page.rect.height)
-        
-        # Copy all content from original page with exact positioning
-        for block in blocks:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        span_text = span["text"]
-                        
-                        # Replace the target text
-                        if old_text in span_text:
-                            span_text = span_text.replace(old_text, new_text)
-                            logging.info(f"Replacing '{old_text}' with '{new_text}'")
-                        
-                        # Insert text with exact formatting and positioning
-                        if span_text.strip():  # Only insert non-empty text
-                            # Use the specified blue color for the title
-                            if new_text in span_text:
-                                color = hex_to_rgb("#0066cc")  # Use the specified blue color
-                            else:
-                                # Handle color conversion for other text
-                                color = span.get("color", (0, 0, 0))
-                                if isinstance(color, (int, float)):
-                                    if color > 0:
-                                        color = (0, 0, 0)  # Keep original color for non-title text
-                                    else:
-                                        color = (0, 0, 0)  # Black for default
-                                elif not isinstance(color, (tuple, list)) or len(color) not in [1, 3, 4]:
-                                    color = (0, 0, 0)  # Default to black
-                            
-                            # Use exact positioning from the original span
-                            new_page.insert_text(
-                                fitz.Point(span["bbox"][0], span["bbox"][3] - 2),
-                                span_text,
-                                fontsize=span["size"],
-                                fontname=span["font"],
-                                color=color
-                            )
-        
-        # Replace the original page with the new one
-        doc.delete_page(0)
-        doc.insert_page(0, new_page)
-        
-        # Save the modified document
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
-        doc.close()
-        
-        logging.info(f"Successfully replaced '{old_text}' with '{new_text}' in {input_path.name}")
-        return True
-        
-    except Exception as e:
-        logging.error(f"Error processing {input_path.name}: {str(e)}")
-        return False
+    pad: float = 0.0
+    use_redact: bool = True
+    y_offset: float = -2.0
+    multi: bool = False
 
 
-def replace_text_in_pdf(input_path: Path, output_path: Path, old_text: str, new_text: str) -> bool:
+# Parameters for each named method; 'simple' is the formatting-free
+# fallback and is dispatched separately in process_pdf
+METHODS = {
+    'clean': MethodParams(pad=3.0, use_redact=False, y_offset=-5.0),
+    'minimal': MethodParams(pad=2.0),
+    'direct': MethodParams(),
+    'overlay': MethodParams(),
+    'precise': MethodParams(),
+    'standard': MethodParams(multi=True),
+}
+
+
+# fitz.Font objects resolved once per worker and shared across documents;
+# None marks names that cannot resolve (e.g. embedded subset names like
+# "ABCDEF+Arial-Bold"), so the failed lookup is not retried per file
+_FONT_CACHE = {}
+
+
+def _resolve_font(fontname: str):
+    """Return a cached fitz.Font for fontname, or None if unresolvable."""
+    if fontname not in _FONT_CACHE:
+        try:
+            _FONT_CACHE[fontname] = fitz.Font(fontname)
+        except Exception:
+            _FONT_CACHE[fontname] = None
+    return _FONT_CACHE[fontname]
+
+
+def _replace_title(doc, page, target_span, output_path: Path, params: MethodParams) -> bool:
     """
-    Replace text in a PDF file using PyMuPDF with better formatting preservation.
-    
+    Replace the located title span according to one method's parameters.
+
+    This is the shared body of all the fitz-based methods: cover the old
+    text, insert the new title with the original font and size, save.
+
     Args:
-        input_path: Path to the input PDF file
+        doc: Open fitz document (owned by the caller)
+        page: First page of the document
+        target_span: Span dict containing the target text
         output_path: Path to save the modified PDF file
-        old_text: Text to replace
-        new_text: New text to insert
-        
+        params: Knobs distinguishing the method
+
     Returns:
         True if successful, False otherwise
     """
+    name = Path(doc.name).name
     try:
-        # Open the PDF document
-        doc = fitz.open(input_path)
-        
-        # Process only the first page
-        page = doc[0]
-        
-        # Get detailed text information
-        text_dict = page.get_text("dict")
-        
-        # Find the exact text instance with formatting info
-        target_span = None
-        for block in text_dict["blocks"]:
-            if "lines" in block:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        if old_text in span["text"]:
-                            target_span = span
-                            break
-                    if target_span:
-                        break
-                if target_span:
-                    break
-        
-        if not target_span:
-            logging.info(f"Text '{old_text}' not found in {input_path.name}")
-            doc.close()
-            return False
-        
-        logging.info(f"Found '{old_text}' in {input_path.name} with font: {target_span['font']}, size: {target_span['size']}")
-        
-        # Search for the text to replace
-        text_instances = page.search_for(old_text)
-        
-        if not text_instances:
-            logging.info(f"Text '{old_text}' not found in {input_path.name}")
-            doc.close()
-            return False
-        
-        logging.info(f"Found {len(text_instances)} instances of '{old_text}' in {input_path.name}")
-        
-        # Replace each instance with exact formatting
-        for rect in text_instances:
-            # Add a white rectangle to cover the old text (exact size)
-            page.add_redact_annot(rect, fill=(1, 1, 1))  # White fill
-            page.apply_redactions()
-            
-            # Insert the new text with exact original formatting
-            point = fitz.Point(rect.x0, rect.y1 - 2)  # Position at the exact location
-            
-            # Use the specified blue color for the title
-            color = hex_to_rgb("#0066cc")  # Use the specified blue color
-            
-            # Use the exact font and size from the original text
+        logging.debug("Found '%s' with font: %s, size: %s",
+                      OLD_TEXT, target_span['font'], target_span['size'])
+
+        if params.multi:
+            # The caller already proved the text is present, so an empty
+            # search result here is not a terminal "not found" - fall back
+            # to the located span's bbox instead of failing
+            rects = page.search_for(OLD_TEXT) or [fitz.Rect(target_span["bbox"])]
+        else:
+            rects = [fitz.Rect(target_span["bbox"])]
+
+        # Register the batch-cached font on this page so insert_text reuses
+        # the already-loaded face instead of re-resolving it per call;
+        # unresolvable names fall through to insert_text's own lookup
+        fontname = target_span["font"]
+        font = _resolve_font(fontname)
+        if font is not None:
+            page.insert_font(fontname=fontname, fontbuffer=font.buffer)
+
+        for rect in rects:
+            # Expand the covered area to ensure complete coverage
+            cover = rect + (-params.pad, -params.pad, params.pad, params.pad)
+            if params.use_redact:
+                page.add_redact_annot(cover, fill=(1, 1, 1))  # White fill
+                page.apply_redactions()
+            else:
+                page.draw_rect(cover, color=(1, 1, 1), fill=(1, 1, 1))
+
+            # Insert the new text at the original position
+            point = fitz.Point(rect.x0, rect.y1 + params.y_offset)
             page.insert_text(
                 point,
-                new_text,
+                NEW_TEXT,
                 fontsize=target_span["size"],
                 fontname=target_span["font"],
-                color=color
+                color=TITLE_COLOR_RGB
             )
-        
+
         # Save the modified document
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
-        doc.close()
-        
-        logging.info(f"Successfully replaced '{old_text}' with '{new_text}' in {input_path.name}")
+        _save_doc(doc, output_path)
+
+        logging.info("Successfully replaced '%s' with '%s' in %s", OLD_TEXT, NEW_TEXT, name)
         return True
-        
+
     except Exception as e:
-        logging.error(f"Error processing {input_path.name}: {str(e)}")
+        logging.error("Error processing %s: %s", name, e)
         return False
 
 
 def process_pdf_simple(input_path: Path, output_path: Path) -> bool:
     """
-    Simple PDF processing using PyPDF2 (fallback method).
-    
+    Simple PDF processing (fallback method).
+
+    Stamps the replacement title onto page 1 without needing the span's
+    original formatting, so it still works when the layout scan fails.
+    Only page 1 is touched; the other pages pass through untouched
+    instead of being re-serialized.
+
     Args:
         input_path: Path to the input PDF file
         output_path: Path to save the processed PDF file
-        
+
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Read the input PDF
-        with open(input_path, 'rb') as input_file:
-            pdf_reader = PyPDF2.PdfReader(input_file)
-            pdf_writer = PyPDF2.PdfWriter()
-            
-            # Process each page
-            for page_num, page in enumerate(pdf_reader.pages):
-                if page_num == 0:  # Only modify the first page
-                    # Extract text to check if it contains "KYC Report"
-                    page_text = page.extract_text()
-                    
-                    if "KYC Report" in page_text:
-                        logging.info(f"Found 'KYC Report' in {input_path.name}, page {page_num + 1}")
-                        
-                        # Create a watermark with "PD Report"
-                        from io import BytesIO
-                        buffer = BytesIO()
-                        c = canvas.Canvas(buffer, pagesize=letter)
-                        c.setFont("Helvetica-Bold", 24)
-                        c.setFillColor(blue)
-                        
-                        # Position the text (adjust coordinates as needed)
-                        width, height = letter
-                        x = 50
-                        y = height - 100
-                        
-                        c.drawString(x, y, "PD Report")
-                        c.save()
-                        
-                        buffer.seek(0)
-                        watermark_reader = PyPDF2.PdfReader(buffer)
-                        watermark_page = watermark_reader.pages[0]
-                        
-                        # Merge the original page with the watermark
-                        page.merge_page(watermark_page)
-                        logging.info(f"Added watermark to page {page_num + 1} in {input_path.name}")
-                    else:
-                        logging.info(f"No 'KYC Report' found in {input_path.name}, page {page_num + 1}")
-                
-                pdf_writer.add_page(page)
-            
+        doc = fitz.open(input_path)
+        try:
+            page = doc[0]
+            hits = page.search_for(OLD_TEXT)
+
+            if hits:
+                logging.debug("Found '%s' in %s, page 1", OLD_TEXT, input_path.name)
+
+                # Remove every occurrence of the old title, then stamp the
+                # new one where the old watermark used to go (blue
+                # Helvetica-Bold, top-left area of the page)
+                for rect in hits:
+                    page.add_redact_annot(rect + (-2, -2, 2, 2), fill=(1, 1, 1))
+                page.apply_redactions()
+                page.insert_text(
+                    fitz.Point(50, 100),
+                    NEW_TEXT,
+                    fontsize=24,
+                    fontname="hebo",
+                    color=(0, 0, 1)
+                )
+                logging.debug("Stamped new title on page 1 in %s", input_path.name)
+            else:
+                logging.debug("No '%s' found in %s, page 1", OLD_TEXT, input_path.name)
+
             # Write the output PDF
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'wb') as output_file:
-                pdf_writer.write(output_file)
-            
-            logging.info(f"Successfully processed {input_path.name} -> {output_path.name}")
-            return True
-            
+            _save_doc(doc, output_path)
+        finally:
+            doc.close()
+
+        logging.info("Successfully processed %s -> %s", input_path.name, output_path.name)
+        return True
+
     except Exception as e:
-        logging.error(f"Error processing {input_path.name}: {str(e)}")
+        logging.error("Error processing %s: %s", input_path.name, e)
         return False
 
 
-def process_pdf(input_path: Path, output_path: Path, method: str = 'clean') -> bool:
+# Window size for the byte-level prefilter scan; the title hint shows up
+# either in an uncompressed content stream near the head or in the
+# document metadata near the tail
+_PREFILTER_WINDOW = 64 * 1024
+_TITLE_HINT = OLD_TEXT.encode("latin-1").split(b" ")[0]
+
+
+def _might_contain_title(input_path: Path) -> bool:
+    """
+    Cheap byte scan of the file's head and tail for the title hint.
+
+    Compressed content streams hide the literal, so a miss is not proof
+    of absence - which is why the prefilter is opt-in.
+    """
+    try:
+        with open(input_path, 'rb') as f:
+            if _TITLE_HINT in f.read(_PREFILTER_WINDOW):
+                return True
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size <= _PREFILTER_WINDOW:
+                return False
+            f.seek(size - _PREFILTER_WINDOW)
+            return _TITLE_HINT in f.read(_PREFILTER_WINDOW)
+    except OSError:
+        # Let the real open surface the error
+        return True
+
+
+def process_pdf(input_path: Path, output_path: Path, method: str = 'clean',
+                prefilter: bool = False) -> bool:
     """
     Process a single PDF file to change "KYC Report" to "PD Report".
-    
+
+    The document is opened and the title span located exactly once; the
+    fallback chain then reuses the open document instead of reopening and
+    rescanning it for every method.
+
     Args:
         input_path: Path to the input PDF file
         output_path: Path to save the processed PDF file
         method: Processing method ('clean', 'minimal', 'direct', 'overlay', 'precise', 'standard', or 'simple')
-        
+        prefilter: Skip parsing files whose raw bytes lack the title hint
+
     Returns:
         True if successful, False otherwise
     """
-    if method == 'clean':
-        # Try clean method first (best text coverage)
-        success = replace_text_clean(input_path, output_path, "KYC Report", "PD Report")
-        if success:
-            return True
-        else:
-            logging.warning(f"Clean method failed for {input_path.name}, trying minimal method")
-            method = 'minimal'
-    
-    if method == 'minimal':
-        # Try minimal method (good layout preservation)
-        success = replace_text_minimal(input_path, output_path, "KYC Report", "PD Report")
-        if success:
-            return True
-        else:
-            logging.warning(f"Minimal method failed for {input_path.name}, trying direct method")
-            method = 'direct'
-    
-    if method == 'direct':
-        # Try direct method (good layout preservation)
-        success = replace_text_direct(input_path, output_path, "KYC Report", "PD Report")
-        if success:
-            return True
-        else:
-            logging.warning(f"Direct method failed for {input_path.name}, trying overlay method")
-            method = 'overlay'
-    
-    if method == 'overlay':
-        # Try overlay method (good alignment preservation)
-        success = replace_text_overlay(input_path, output_path, "KYC Report", "PD Report")
-        if success:
-            return True
-        else:
-            logging.warning(f"Overlay method failed for {input_path.name}, trying precise method")
-            method = 'precise'
-    
-    if method == 'precise':
-        # Try precise method
-        success = replace_text_precise(input_path, output_path, "KYC Report", "PD Report")
-        if success:
-            return True
-        else:
-            logging.warning(f"Precise method failed for {input_path.name}, trying standard method")
-            method = 'standard'
-    
-    if method == 'standard':
-        # Try standard advanced method
-        success = replace_text_in_pdf(input_path, output_path, "KYC Report", "PD Report")
-        if success:
-            return True
-        else:
-            logging.warning(f"Standard method failed for {input_path.name}, trying simple method")
-            method = 'simple'
-    
+    if prefilter and not _might_contain_title(input_path):
+        # Nothing to replace; mirror the file into the output tree without
+        # paying for xref/catalog parsing
+        logging.debug("Prefilter: no '%s' hint in %s, copying through", OLD_TEXT, input_path.name)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(input_path, output_path)
+        return True
+
     if method == 'simple':
-        # Fallback to simple method
+        # Fallback watermark method needs no fitz document
         return process_pdf_simple(input_path, output_path)
-    
-    return False
 
+    order = METHOD_ORDER[METHOD_ORDER.index(method):]
+
+    # Open the document and locate the title span once for all methods
+    doc = None
+    try:
+        doc, page, target_span = _open_and_find_span(input_path, OLD_TEXT)
+    except Exception as e:
+        logging.error("Error opening %s: %s", input_path.name, e)
+
+    try:
+        if doc is not None:
+            if target_span is None:
+                logging.info("Text '%s' not found in %s", OLD_TEXT, input_path.name)
+            else:
+                tried = set()
+                for name in order:
+                    if name == 'simple':
+                        break
+                    params = METHODS[name]
+                    if params in tried:
+                        # Identical parameters already failed; retrying
+                        # them cannot succeed
+                        continue
+                    tried.add(params)
+                    if _replace_title(doc, page, target_span, output_path, params):
+                        return True
+                    logging.warning("%s method failed for %s, trying next method", name, input_path.name)
+    finally:
+        if doc is not None:
+            doc.close()
+
+    # Fallback to simple method
+    return process_pdf_simple(input_path, output_path)
 
 def copy_non_pdf_files(input_dir: Path, output_dir: Path) -> None:
     """
@@ -742,57 +442,118 @@ def copy_non_pdf_files(input_dir: Path, output_dir: Path) -> None:
             
             # Copy the file
             shutil.copy2(item, dest_path)
-            logging.info(f"Copied non-PDF file: {relative_path}")
+            logging.info("Copied non-PDF file: %s", relative_path)
+
+
+def _init_worker() -> None:
+    """
+    Configure a pool worker process.
+
+    Besides logging, silence MuPDF's direct stderr chatter: parallel
+    workers interleave it unreadably, and real failures already surface
+    through Python exceptions and the log.
+    """
+    setup_logging()
+    fitz.TOOLS.mupdf_display_errors(False)
+
 
+def _process_pdf_star(args) -> bool:
+    """Unpack an (input, output, method) task for executor.map (picklable)."""
+    try:
+        return process_pdf(*args)
+    finally:
+        # MuPDF caches decoded fonts and images in a per-context store
+        # that is unbounded by default and can grow past 1GB on
+        # image-heavy files; empty it between files so long batches keep
+        # worker RSS flat
+        fitz.TOOLS.store_shrink(100)
 
-def process_directory(input_dir: Path, output_dir: Optional[Path] = None, method: str = 'clean') -> None:
+
+def process_directory(input_dir: Path, output_dir: Optional[Path] = None, method: str = 'clean',
+                      workers: Optional[int] = None, executor: Optional[str] = None,
+                      prefilter: bool = False, force: bool = False) -> None:
     """
     Process all PDF files in the input directory and its subdirectories.
     Creates a separate processed directory with the same structure.
-    
+
     Args:
         input_dir: Directory containing PDF files to process
         output_dir: Directory to save processed files (defaults to {input_dir}_processed)
         method: Processing method ('clean', 'minimal', 'direct', 'overlay', 'precise', 'standard', or 'simple')
+        workers: Number of workers (defaults to min(cpu_count, 4))
+        executor: 'process' or 'thread' (defaults to threads for small
+            batches, where process spawn cost dominates)
+        prefilter: Byte-scan files for the title hint before parsing them
+        force: Reprocess files even when their output is already up to date
     """
     if output_dir is None:
         # Create output directory name as {directory_name}_processed
         output_dir = input_dir.parent / f"{input_dir.name}_processed"
-    
+
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 4)
+
     # Find all PDF files recursively
     pdf_files = find_pdf_files(input_dir)
-    
+
     if not pdf_files:
-        logging.warning(f"No PDF files found in {input_dir}")
+        logging.warning("No PDF files found in %s", input_dir)
         # Still copy non-PDF files even if no PDFs found
         copy_non_pdf_files(input_dir, output_dir)
         return
-    
+
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
-    logging.info(f"Output directory: {output_dir}")
-    
-    # Process each PDF file, preserving directory structure
-    successful = 0
-    failed = 0
-    
+    logging.info("Output directory: %s", output_dir)
+
+    # PyMuPDF releases the GIL inside its heavy C calls (save, redaction),
+    # so threads still parallelize while skipping process spawn cost; use
+    # them by default when the batch is too small to amortize the spawns
+    if executor is None:
+        executor = 'thread' if len(pdf_files) < 16 else 'process'
+    logging.info("Using %d %s workers", workers, executor)
+
+    # Build the per-file tasks, preserving directory structure. Outputs
+    # that already exist and are at least as new as their input are
+    # finished work from an earlier run; skip them unless forced.
+    tasks = []
+    skipped = 0
     for pdf_file in pdf_files:
         # Calculate relative path from input_dir
         relative_path = pdf_file.relative_to(input_dir)
         output_file = output_dir / relative_path
-        
+
+        if (not force and output_file.exists()
+                and output_file.stat().st_mtime >= pdf_file.stat().st_mtime):
+            skipped += 1
+            continue
+
         # Create parent directories if they don't exist
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        if process_pdf(pdf_file, output_file, method):
-            successful += 1
+
+        tasks.append((pdf_file, output_file, method, prefilter))
+
+    if skipped:
+        logging.info("Skipped %d already-processed files (use --force to redo)", skipped)
+
+    # Process the PDF files in parallel; each file is independent, so the
+    # batch splits cleanly across workers
+    results = []
+    if tasks:
+        if executor == 'thread':
+            pool = ThreadPoolExecutor(max_workers=workers)
         else:
-            failed += 1
-    
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        with pool:
+            results = list(pool.map(_process_pdf_star, tasks, chunksize=4))
+
+    successful = sum(results) + skipped
+    failed = len(results) - sum(results)
+
     # Copy all non-PDF files to preserve complete directory structure
     copy_non_pdf_files(input_dir, output_dir)
-    
-    logging.info(f"Processing complete: {successful} successful, {failed} failed")
+
+    logging.info("Processing complete: %d successful, %d failed", successful, failed)
 
 
 def main():
@@ -835,12 +596,39 @@ Examples:
         help='Choose processing method: clean (best text coverage), minimal (best layout), direct (good layout), overlay (best alignment), precise (best formatting), standard (faster), or simple (watermark)'
     )
     
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reprocess files even when their output is already up to date'
+    )
+
+    parser.add_argument(
+        '--fast-prefilter',
+        action='store_true',
+        help='Byte-scan files for the title before parsing them; faster on '
+             'batches with many non-matching files, but can miss titles '
+             'hidden in compressed streams'
+    )
+
+    parser.add_argument(
+        '--executor',
+        choices=['process', 'thread'],
+        help='Executor type (default: thread for batches under 16 files, process otherwise)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=min(os.cpu_count() or 1, 4),
+        help='Number of worker processes (default: min(cpu_count, 4))'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help='Enable verbose logging'
     )
-    
+
     args = parser.parse_args()
     
     # Setup logging
@@ -853,8 +641,8 @@ Examples:
     output_dir = Path(args.output_dir).resolve() if args.output_dir else None
     
     try:
-        logging.info(f"Starting PDF processing...")
-        logging.info(f"Input directory: {input_dir}")
+        logging.info("Starting PDF processing...")
+        logging.info("Input directory: %s", input_dir)
         
         # Determine processing method
         if args.simple:
@@ -862,14 +650,16 @@ Examples:
         else:
             method = args.method
             
-        logging.info(f"Using {method} processing method")
+        logging.info("Using %s processing method", method)
         
-        process_directory(input_dir, output_dir, method)
+        process_directory(input_dir, output_dir, method, workers=args.workers,
+                          executor=args.executor, prefilter=args.fast_prefilter,
+                          force=args.force)
         
         logging.info("PDF processing completed successfully!")
         
     except Exception as e:
-        logging.error(f"Fatal error: {str(e)}")
+        logging.error("Fatal error: %s", e)
         sys.exit(1)
 
 